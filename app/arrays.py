@@ -0,0 +1,13 @@
+from tsdownsample import MinMaxLTTBDownsampler
+import numpy as np
+
+def format_dates(dates: np.ndarray) -> list:
+    """Render datetime64 values as YYYY-MM-DD strings in one vectorized call."""
+    return np.datetime_as_string(dates.astype("datetime64[D]", copy=False), unit="D").tolist()
+
+def downsample(x: np.ndarray, y: np.ndarray, n_out: int):
+    """Keep n_out visually representative points of y (MinMaxLTTB) and matching x."""
+    if y.size <= n_out:
+        return x, y
+    idx = MinMaxLTTBDownsampler().downsample(y, n_out=n_out)
+    return x[idx], y[idx]
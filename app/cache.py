@@ -0,0 +1,128 @@
+from cachetools import TTLCache
+from collections import deque
+from datetime import timedelta
+from typing import NamedTuple
+import asyncio
+import hashlib
+import logging
+import orjson
+import time
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL = timedelta(minutes=30)
+CACHE_TTL_SEC = CACHE_TTL.total_seconds()
+CACHE_MAXSIZE = 1024
+
+class CacheEntry(NamedTuple):
+    bytes: bytes  # only the serialized payload is kept; responses never re-encode
+    etag: str
+    expires_at: float  # time.monotonic() deadline, same clock as TTLCache
+
+# Bounded LRU with monotonic-clock expiry. Only touched from the event loop
+# thread (all cached routes are async), so no lock is needed.
+CACHE = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL_SEC)
+
+def cache_get(key: str):
+    return CACHE.get(key)
+
+def cache_set(key: str, data: dict):
+    # Serialize (and hash for the ETag) once on store so cache hits skip JSON encoding
+    payload = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+    entry = CacheEntry(payload, etag, time.monotonic() + CACHE_TTL_SEC)
+    CACHE[key] = entry
+    return entry
+
+# Misses currently being fetched, so concurrent requests share one upstream call
+INFLIGHT: dict = {}
+
+async def cache_fetch(key: str, fetch):
+    """Return the cache entry for key, calling fetch() at most once per miss."""
+    entry = await _cache_fetch(key, fetch)
+    # Only requests that got data count towards hotness, so failing keys are never refreshed
+    record_hit(key, fetch)
+    return entry
+
+async def _cache_fetch(key: str, fetch):
+    if entry := cache_get(key):
+        return entry
+    if key in INFLIGHT:
+        leader = INFLIGHT[key]
+        try:
+            return await asyncio.shield(leader)
+        except asyncio.CancelledError:
+            # Task.cancelling() is Python 3.11+, the minimum this app supports
+            if not leader.cancelled() or asyncio.current_task().cancelling():
+                raise  # this request itself was cancelled
+            # The leading request was cancelled mid-fetch; take the fetch over
+            return await _cache_fetch(key, fetch)
+    return await _lead_fetch(key, fetch)
+
+async def _lead_fetch(key: str, fetch):
+    """Run fetch() for key as the in-flight call that concurrent misses wait on."""
+    fut = asyncio.get_running_loop().create_future()
+    INFLIGHT[key] = fut
+    try:
+        entry = cache_set(key, await fetch())
+        fut.set_result(entry)
+        return entry
+    except asyncio.CancelledError:
+        fut.cancel()
+        raise
+    except Exception as e:
+        fut.set_exception(e)
+        fut.exception()  # mark retrieved; each waiter re-raises it on await
+        raise
+    finally:
+        INFLIGHT.pop(key, None)
+
+# -------------------- Background Refresh --------------------
+# Keys requested HOT_MIN_HITS times within HOT_WINDOW are re-fetched every
+# REFRESH_INTERVAL, before their TTL runs out, so readers never wait on upstream.
+HOT_WINDOW = timedelta(hours=1)
+HOT_MIN_HITS = 3
+REFRESH_INTERVAL = CACHE_TTL / 2
+
+# key -> (fetch, times of its last HOT_MIN_HITS requests). Bounded like CACHE;
+# keys idle for a whole window expire on their own.
+HITS = TTLCache(maxsize=CACHE_MAXSIZE, ttl=HOT_WINDOW.total_seconds())
+
+def record_hit(key: str, fetch):
+    _, hits = HITS.get(key) or (None, deque(maxlen=HOT_MIN_HITS))
+    hits.append(time.monotonic())
+    HITS[key] = (fetch, hits)  # re-set to restart the key's idle TTL
+
+def hot_keys() -> dict:
+    """Return {key: fetch} for keys requested HOT_MIN_HITS times within HOT_WINDOW."""
+    cutoff = time.monotonic() - HOT_WINDOW.total_seconds()
+    return {
+        key: fetch for key, (fetch, hits) in list(HITS.items())
+        if len(hits) == HOT_MIN_HITS and hits[0] >= cutoff
+    }
+
+async def refresh_hot_keys():
+    # Only entries that would expire before the next pass; fresher ones can wait.
+    # Keys already being fetched by a request are skipped, and refreshes register in
+    # INFLIGHT themselves, so a key never has two upstream calls at once.
+    deadline = time.monotonic() + REFRESH_INTERVAL.total_seconds()
+    hot = {
+        key: fetch for key, fetch in hot_keys().items()
+        if key not in INFLIGHT
+        and ((entry := cache_get(key)) is None or entry.expires_at <= deadline)
+    }
+    results = await asyncio.gather(
+        *(_lead_fetch(key, fetch) for key, fetch in hot.items()), return_exceptions=True
+    )
+    for key, result in zip(hot, results):
+        # On failure keep serving the current entry until it expires
+        if isinstance(result, Exception):
+            logger.warning("Refreshing %s failed: %s", key, result)
+
+async def refresher():
+    while True:
+        await asyncio.sleep(REFRESH_INTERVAL.total_seconds())
+        try:
+            await refresh_hot_keys()
+        except Exception:
+            logger.exception("Background cache refresh pass failed")
@@ -0,0 +1,31 @@
+from concurrent.futures import ProcessPoolExecutor
+import httpx
+import multiprocessing
+import os
+
+# One pooled HTTP/2 client shared by all upstream calls, opened/closed with the app;
+# keep-alive connections skip the TLS handshake on every cache miss
+http_client: httpx.AsyncClient = None
+# Worker processes for CPU-heavy parsing, so it neither holds the GIL nor blocks the loop.
+# Parsing takes milliseconds, so a couple of workers suffice regardless of host size.
+PROCESS_POOL_WORKERS = int(os.getenv("PROCESS_POOL_WORKERS", "2"))
+process_pool: ProcessPoolExecutor = None
+
+def open_clients():
+    global http_client, process_pool
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        timeout=10.0,
+        headers={"User-Agent": "Mozilla/5.0"},
+    )
+    # forkserver: workers must not be forked from this process, which already runs
+    # threads (AnyIO, DNS resolution) by the first cache miss, so a fork could deadlock
+    process_pool = ProcessPoolExecutor(
+        max_workers=PROCESS_POOL_WORKERS, mp_context=multiprocessing.get_context("forkserver")
+    )
+    process_pool.submit(int)  # start the workers now rather than on the first request
+
+async def close_clients():
+    await http_client.aclose()
+    process_pool.shutdown(wait=False, cancel_futures=True)  # don't block the event loop
@@ -0,0 +1,2 @@
+from app.fetchers.fred import fetch_fred_series
+from app.fetchers.yahoo import fetch_yahoo
@@ -0,0 +1,85 @@
+from app import clients
+from app.arrays import downsample, format_dates
+import asyncio
+import httpx
+import numpy as np
+import orjson
+import os
+
+FRED_API_KEY = os.getenv("FRED_API_KEY")
+FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
+
+# Cap concurrent upstream calls (FRED allows 120 requests/min per key)
+FRED_SEMAPHORE = asyncio.Semaphore(8)
+
+def _infer_yoy_lag(dates: np.ndarray) -> int:
+    # 12 for monthly, 4 for quarterly, default 12
+    if dates.size >= 2:
+        gap = int((dates[-1] - dates[-2]).astype(np.int64))
+        if 80 <= gap <= 100:
+            return 4
+    return 12
+
+async def fetch_fred_series(
+    series_id: str, transform: str = None, max_points: int = 240, n_out: int = None
+):
+    """Fetch FRED series, drop NaNs, optional YoY, and trim (or downsample) history."""
+    params = {
+        "series_id": series_id,
+        "api_key": FRED_API_KEY,
+        "file_type": "json",
+        "sort_order": "asc",
+    }
+    # Never surface httpx errors as-is: their messages include the URL, i.e. the api_key
+    try:
+        async with FRED_SEMAPHORE:
+            r = await clients.http_client.get(FRED_OBSERVATIONS_URL, params=params)
+    except httpx.HTTPError:
+        raise ValueError(f"FRED request failed for {series_id}") from None
+    if r.status_code != 200:
+        try:
+            message = orjson.loads(r.content).get("error_message")
+        except (orjson.JSONDecodeError, AttributeError):
+            message = None
+        raise ValueError(message or f"FRED returned HTTP {r.status_code} for {series_id}")
+
+    # Full histories (e.g. daily series) are MBs of JSON; parse them in a worker.
+    # Only the raw bytes go in and the trimmed payload comes back.
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        clients.process_pool, _compute_fred, series_id, r.content, transform, max_points, n_out
+    )
+
+def _compute_fred(series_id: str, content: bytes, transform, max_points, n_out) -> dict:
+    observations = orjson.loads(content).get("observations") or []
+    if not observations:
+        raise ValueError(f"No data returned for FRED series {series_id}")
+
+    # FRED marks missing observations with "."; mask them out, then convert the
+    # remaining strings to float64 in one C-level cast
+    raw = np.array([o["value"] for o in observations])
+    mask = raw != "."
+    vals = raw[mask].astype(np.float64)
+    dates = np.array([o["date"] for o in observations], dtype="datetime64[D]")[mask]
+
+    if transform == "yoy":
+        lag = _infer_yoy_lag(dates)
+        vals = (vals[lag:] / vals[:-lag] - 1.0) * 100.0
+        dates = dates[lag:]
+        mask = np.isfinite(vals)
+        dates, vals = dates[mask], vals[mask]
+
+    # Trim payload (e.g., last 240 points ≈ 20 years monthly / 60 years quarterly),
+    # or with n_out keep the full history's shape in n_out points
+    if n_out:
+        dates, vals = downsample(dates, vals, n_out)
+    elif max_points:
+        dates, vals = dates[-max_points:], vals[-max_points:]
+
+    if not vals.size:
+        raise ValueError(f"No usable observations for {series_id}")
+
+    # Columnar history, same shape as /quote: {"dates": [...], "values": [...]};
+    # values go out as float32, plenty of precision for charting
+    history = {"dates": format_dates(dates), "values": vals.astype(np.float32)}
+    return {"series_id": series_id, "history": history, "latest": float(vals[-1])}
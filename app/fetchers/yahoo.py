@@ -0,0 +1,54 @@
+from app import clients
+from app.arrays import downsample, format_dates
+import asyncio
+import httpx
+import numpy as np
+
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+
+# Cap concurrent upstream calls
+YAHOO_SEMAPHORE = asyncio.Semaphore(8)
+
+async def fetch_yahoo(symbol: str, n_out: int = None):
+    # range=ytd starts at the first trading day of the year, so YTD is precise
+    params = {"range": "ytd", "interval": "1d"}
+    try:
+        async with YAHOO_SEMAPHORE:
+            r = await clients.http_client.get(YAHOO_CHART_URL.format(symbol=symbol), params=params)
+        chart = r.json().get("chart") or {}
+    except (httpx.HTTPError, ValueError, AttributeError):
+        raise ValueError(f"Yahoo request failed for {symbol}") from None
+    if r.status_code != 200:
+        # Unknown symbols come back as 404 with chart.error.description
+        error = chart.get("error") or {}
+        raise ValueError(error.get("description") or f"No data returned for {symbol}")
+    results = chart.get("result") or []
+    if not results or not results[0].get("timestamp"):
+        raise ValueError(f"No data returned for {symbol}")
+
+    result = results[0]
+    offset = result["meta"].get("gmtoffset", 0)  # exchange-local trading dates
+    stamps = np.array(result["timestamp"], dtype=np.int64) + offset
+    closes = np.array(result["indicators"]["quote"][0]["close"], dtype=np.float64)  # null -> NaN
+    mask = ~np.isnan(closes)
+    stamps, closes = stamps[mask], closes[mask]
+    if not closes.size:
+        raise ValueError(f"No data returned for {symbol}")
+
+    first_price = float(closes[0])
+    latest_price = float(closes[-1])
+    pct_ytd = ((latest_price - first_price) / first_price) * 100.0
+
+    if n_out:
+        stamps, closes = downsample(stamps, closes, n_out)
+    data = {
+        "symbol": symbol,
+        "latest": latest_price,
+        "ytd_change": pct_ytd,
+        "history": {
+            "dates": format_dates(stamps.astype("datetime64[s]")),
+            # float32 ndarray: encoded by orjson without boxing, in shorter float strings
+            "values": np.round(closes, 5).astype(np.float32),
+        },
+    }
+    return data
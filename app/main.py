@@ -0,0 +1,133 @@
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import Response
+from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel, Field
+from app import clients
+from app.cache import CacheEntry, cache_fetch, refresher
+from app.fetchers import fetch_fred_series, fetch_yahoo
+import asyncio
+import orjson
+import time
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    clients.open_clients()
+    refresher_task = asyncio.create_task(refresher())
+    try:
+        yield
+    finally:
+        refresher_task.cancel()
+        await clients.close_clients()
+
+class OrjsonResponse(Response):
+    """JSON encoded with orjson; stands in for FastAPI's deprecated ORJSONResponse."""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+app = FastAPI(lifespan=lifespan, default_response_class=OrjsonResponse)
+
+# -------------------- CORS --------------------
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],  # restrict in production: ["https://gabriellaraney.github.io"]
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# -------------------- Responses --------------------
+def cached_response(entry: CacheEntry, request: Request) -> Response:
+    """Serve a cache entry, or 304 Not Modified if the client already has it."""
+    # Browsers may reuse the payload only for as long as the server-side entry lives
+    max_age = max(0, int(entry.expires_at - time.monotonic()))
+    headers = {"ETag": entry.etag, "Cache-Control": f"max-age={max_age}"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if entry.etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.bytes, media_type="application/json", headers=headers)
+
+# -------------------- Routes --------------------
+@app.get("/")
+def home():
+    return {"message": "Economic Dashboard Backend is running ✅"}
+
+def quote_entry(symbol: str, n_out: int = None):
+    key = f"quote:{symbol}:{n_out}"
+    return cache_fetch(key, lambda: fetch_yahoo(symbol, n_out))
+
+def splice_entries(ids: list, results: list) -> bytes:
+    """Join cached payloads into one JSON object {id: payload | {"error": ...}}.
+
+    The cached bytes are reused as-is rather than re-encoding (histories hold NumPy arrays).
+    """
+    body = b",".join(
+        orjson.dumps(i) + b":"
+        + (orjson.dumps({"error": str(r)}) if isinstance(r, BaseException) else r.bytes)
+        for i, r in zip(ids, results)
+    )
+    return b"{" + body + b"}"
+
+@app.get("/quote/{symbol}")
+async def get_quote(request: Request, symbol: str, n_out: int = Query(None, ge=3)):
+    try:
+        entry = await quote_entry(symbol, n_out)
+        return cached_response(entry, request)
+    except Exception as e:
+        return OrjsonResponse(content={"error": str(e)}, status_code=500)
+
+def fred_entry(series_id: str, transform: str = None, n_out: int = None):
+    key = f"fred:{series_id}:{transform}:{n_out}"
+    return cache_fetch(key, lambda: fetch_fred_series(series_id, transform, n_out=n_out))
+
+@app.get("/fred/{series_id}")
+async def get_fred(
+    request: Request, series_id: str, transform: str = None, n_out: int = Query(None, ge=3)
+):
+    try:
+        entry = await fred_entry(series_id, transform, n_out)
+        return cached_response(entry, request)
+    except Exception as e:
+        return OrjsonResponse(content={"error": str(e)}, status_code=500)
+
+# Upper bound on items per multi-series request, to protect the FRED rate limit
+MAX_BATCH_ITEMS = 50
+
+class BatchReq(BaseModel):
+    series_ids: list[str] = Field(max_length=MAX_BATCH_ITEMS)
+    transform: str | None = None
+    n_out: int | None = Field(None, ge=3)
+
+@app.post("/fred/batch")
+async def fred_batch(req: BatchReq):
+    # Fetched concurrently through the per-series cache; FRED_SEMAPHORE caps upstream calls
+    series_ids = list(dict.fromkeys(req.series_ids))
+    results = await asyncio.gather(
+        *(fred_entry(sid, req.transform, req.n_out) for sid in series_ids), return_exceptions=True
+    )
+    return Response(content=splice_entries(series_ids, results), media_type="application/json")
+
+@app.get("/dashboard")
+async def dashboard(
+    fred: str = "", quote: str = "", transform: str = None, n_out: int = Query(None, ge=3)
+):
+    """Serve a whole page in one round trip, e.g. /dashboard?fred=CPIAUCSL,UNRATE&quote=SPY."""
+    series_ids = list(dict.fromkeys(s for s in fred.split(",") if s))
+    symbols = list(dict.fromkeys(s for s in quote.split(",") if s))
+    if len(series_ids) + len(symbols) > MAX_BATCH_ITEMS:
+        raise HTTPException(
+            status_code=422, detail=f"At most {MAX_BATCH_ITEMS} series and symbols combined"
+        )
+    results = await asyncio.gather(
+        *(fred_entry(sid, transform, n_out) for sid in series_ids),
+        *(quote_entry(sym, n_out) for sym in symbols),
+        return_exceptions=True,
+    )
+    fred_results, quote_results = results[:len(series_ids)], results[len(series_ids):]
+    body = (
+        b'{"fred":' + splice_entries(series_ids, fred_results)
+        + b',"quotes":' + splice_entries(symbols, quote_results) + b"}"
+    )
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from app import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.CACHE.clear()
+    cache.HITS.clear()
+    cache.INFLIGHT.clear()
+
+
+def test_concurrent_misses_share_one_fetch():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"x": 1}
+
+    async def main():
+        return await asyncio.gather(*(cache.cache_fetch("k", fetch) for _ in range(10)))
+
+    entries = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(e.bytes == b'{"x":1}' for e in entries)
+    assert "k" not in cache.INFLIGHT
+
+
+def test_fetch_error_reaches_every_waiter():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream down")
+
+    async def main():
+        return await asyncio.gather(
+            *(cache.cache_fetch("k", fetch) for _ in range(5)), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(isinstance(r, ValueError) and str(r) == "upstream down" for r in results)
+    assert "k" not in cache.CACHE and "k" not in cache.INFLIGHT
+
+
+def test_waiter_takes_over_from_cancelled_leader():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"x": len(calls)}
+
+    async def main():
+        leader = asyncio.create_task(cache.cache_fetch("k", fetch))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(cache.cache_fetch("k", fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await waiter
+
+    entry = asyncio.run(main())
+    assert len(calls) == 2
+    assert entry.bytes == b'{"x":2}'
+
+
+def test_cancelled_waiter_leaves_leader_running():
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return {"x": 1}
+
+    async def main():
+        leader = asyncio.create_task(cache.cache_fetch("k", fetch))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(cache.cache_fetch("k", fetch))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return await leader
+
+    assert asyncio.run(main()).bytes == b'{"x":1}'
+
+
+def test_refresh_and_request_miss_share_one_fetch():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return {"x": len(calls)}
+
+    async def main():
+        for _ in range(cache.HOT_MIN_HITS):
+            await cache.cache_fetch("k", fetch)
+        cache.CACHE.clear()  # e.g. evicted: the hot key is due for refresh
+        refresh = asyncio.create_task(cache.refresh_hot_keys())
+        await asyncio.sleep(0.005)
+        entry = await cache.cache_fetch("k", fetch)
+        await refresh
+        return entry
+
+    entry = asyncio.run(main())
+    assert len(calls) == 2  # initial miss + one shared refresh
+    assert entry.bytes == b'{"x":2}'